@@ -9,15 +9,25 @@ evitar leituras repetidas de QRCode quando desejado).
 from __future__ import annotations
 
 import argparse
+import json
 import logging
+import re
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
+import urllib3
 from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,6 +37,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 # sem Chrome pré-instalado.
 import chromedriver_py
 
+try:  # O python-calamine (em Rust) lê planilhas bem mais rápido que o openpyxl.
+    from python_calamine import CalamineWorkbook
+except Exception:  # noqa: BLE001 - o pacote é opcional; usamos o openpyxl como fallback.
+    CalamineWorkbook = None
+
 try:  # Preferimos o webdriver_manager por baixar a versão alinhada ao Chrome instalado.
     from webdriver_manager.chrome import ChromeDriverManager
 except Exception:  # noqa: BLE001 - o pacote é opcional; cairemos no fallback embutido.
@@ -46,17 +61,135 @@ DEFAULT_MESSAGE = (
     "Contamos com sua presença!\n"
 )
 
+# Compilado uma única vez: a remoção de caracteres não numéricos roda no motor de
+# regex em C em vez de um laço Python por caractere.
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# Conexões HTTP simultâneas mantidas com o chromedriver.
+CONNECTION_POOL_SIZE = 10
+
+# Mensagens enviadas na conversa aberta; a barra lateral fica fora de `#main`.
+OUTGOING_MESSAGE_SELECTOR = '#main div.message-out'
+# Ícones que o WhatsApp Web exibe quando a mensagem sai do aparelho/servidor.
+SENT_MARK_SELECTOR = 'span[data-icon^="msg-check"], span[data-icon^="msg-dblcheck"]'
+# Identifica a última mensagem enviada (`data-id` fica nela ou em um ancestral).
+_LAST_OUTGOING_JS = """
+const outgoing = document.querySelectorAll(arguments[0]);
+const last = outgoing[outgoing.length - 1];
+if (!last) return [null, false];
+const holder = last.closest('[data-id]') || last.querySelector('[data-id]');
+return [holder ? holder.getAttribute('data-id') : null, last.querySelector(arguments[1]) !== null];
+"""
+
+# A cada quantos números processados uma linha de progresso é registrada; o sucesso
+# de cada envio individual só aparece com `--log-level DEBUG`.
+PROGRESS_LOG_EVERY = 50
+
+# Intervalo mínimo (s) entre envios, mesmo quando a confirmação chega antes.
+MIN_SEND_INTERVAL = 1.0
+
+DEFAULT_COUNTRY_CODE = "55"
+
+WHATSAPP_URL = "https://web.whatsapp.com/"
+
+# Tempo (s) para o usuário ler o QRCode; bem maior que a espera por elementos.
+DEFAULT_QR_TIMEOUT = 300
+
+# Formatação pré-resolvida da URL de conversa; recebe `country_code` e `number`.
+_SEND_URL_FMT = (
+    "https://web.whatsapp.com/send/?phone={country_code}{number}"
+    "&text&type=phone_number&app_absent=0"
+).format
+
+# Condições de espera sem estado, criadas uma única vez e reaproveitadas a cada envio.
+_TITLE_COND = EC.title_contains('WhatsApp')
+# Seletor por atributos em vez de XPath absoluto: é resolvido pelo `querySelector`
+# nativo e não quebra quando o WhatsApp reorganiza o DOM. Aguardamos o elemento
+# ficar clicável para não digitar antes de o React registrar os handlers.
+_BOX_LOCATOR = (By.CSS_SELECTOR, 'footer div[contenteditable="true"][data-tab]')
+_BOX_COND = EC.element_to_be_clickable(_BOX_LOCATOR)
+# A lista de conversas só existe com a sessão autenticada; o QRCode, só sem ela.
+_LOGGED_IN_LOCATOR = (By.CSS_SELECTOR, '#side')
+_QR_LOCATOR = (By.CSS_SELECTOR, 'div[data-ref], canvas[aria-label]')
+_LOGIN_STATE_COND = EC.any_of(
+    EC.presence_of_element_located(_LOGGED_IN_LOCATOR),
+    EC.presence_of_element_located(_QR_LOCATOR),
+)
+_LOGGED_IN_COND = EC.presence_of_element_located(_LOGGED_IN_LOCATOR)
+
+# Argumentos que reduzem o custo de carregamento e a memória de cada Chrome.
+LOW_FOOTPRINT_CHROME_ARGS = (
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--blink-settings=imagesEnabled=false",
+)
+
+# Perfil do Chrome persistente: o login feito na primeira execução é reaproveitado.
+DEFAULT_USER_DATA_DIR = Path.home() / ".wpp-sender" / "chrome-profile"
+
+# Onde `--keep-session` grava os dados para reaproveitar a sessão depois.
+SESSION_FILE = Path.home() / ".wpp_session.json"
+
 
 @dataclass
 class RunStats:
-    """Agrega os números enviados com sucesso e com falha."""
+    """Agrega a quantidade de envios com sucesso e os números com falha."""
 
-    successful_numbers: list[str]
-    failed_numbers: list[str]
+    successful_count: int = 0
+    failed_numbers: list[str] = field(default_factory=list)
 
     @property
     def total(self) -> int:
-        return len(self.successful_numbers) + len(self.failed_numbers)
+        return self.successful_count + len(self.failed_numbers)
+
+    @classmethod
+    def merge(cls, results: Iterable[RunStats]) -> RunStats:
+        merged = cls()
+        for result in results:
+            merged.successful_count += result.successful_count
+            merged.failed_numbers.extend(result.failed_numbers)
+        return merged
+
+
+@dataclass
+class ProgressLog:
+    """Conta os números processados por todos os navegadores e registra o progresso."""
+
+    total: int | None = None
+    processed: int = 0
+    failed: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            self.processed += 1
+            if not success:
+                self.failed += 1
+            if self.processed % PROGRESS_LOG_EVERY == 0 or self.processed == self.total:
+                logging.info(
+                    "Progresso: %s/%s números processados (%s com erro)",
+                    self.processed,
+                    self.total if self.total is not None else "?",
+                    self.failed,
+                )
+
+
+@dataclass
+class BrowserState:
+    """Estado de envio de um navegador do pool, mantido entre as mensagens."""
+
+    # O WhatsApp Web já foi carregado nesta aba (dispensa `browser.get`).
+    loaded: bool = False
+    # `False` depois que `Page.navigate` falha uma vez; passa a navegar por JavaScript.
+    cdp_available: bool = True
+    # Instante (`time.monotonic`) a partir do qual o próximo envio pode acontecer.
+    next_send_at: float = 0.0
+
+
+# Navegador, espera e estado de um integrante do pool.
+PooledBrowser = tuple[webdriver.Chrome, WebDriverWait, BrowserState]
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -76,6 +209,16 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default="A",
         help="Coluna com os números de telefone (padrão: %(default)s)",
     )
+    parser.add_argument(
+        "--header-rows",
+        type=int,
+        default=1,
+        help=(
+            "Quantidade de linhas de cabeçalho ignoradas no início da planilha. "
+            "Use 0 em planilhas sem cabeçalho para não perder o primeiro número "
+            "(padrão: %(default)s)"
+        ),
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -91,7 +234,15 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         "--delay",
         type=float,
         default=5.0,
-        help="Tempo (s) de espera entre envios (padrão: %(default).1f)s",
+        help=(
+            "Tempo máximo (s) de espera pela confirmação de envio de cada mensagem "
+            "(padrão: %(default).1f)s"
+        ),
+    )
+    parser.add_argument(
+        "--country-code",
+        default=DEFAULT_COUNTRY_CODE,
+        help="Código do país prefixado aos números; apenas os dígitos são usados (padrão: %(default)s)",
     )
     parser.add_argument(
         "--report-number",
@@ -106,15 +257,65 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--user-data-dir",
         type=Path,
+        default=DEFAULT_USER_DATA_DIR,
         help=(
-            "Diretório de perfil do Chrome a ser reutilizado. Útil para reduzir a "
-            "necessidade de ler o QRCode em execuções subsequentes."
+            "Diretório de perfil do Chrome a ser reutilizado. Mantém o login do "
+            "WhatsApp Web e evita ler o QRCode em execuções subsequentes "
+            "(padrão: %(default)s)"
         ),
     )
+    parser.add_argument(
+        "--profile-directory",
+        default="Default",
+        help="Perfil dentro de --user-data-dir a ser usado (padrão: %(default)s)",
+    )
     parser.add_argument(
         "--headless",
         action="store_true",
-        help="Roda o Chrome em modo headless (pode exigir sessão previamente autenticada).",
+        default=True,
+        help=(
+            "Roda o Chrome em modo headless (padrão). Exige sessão previamente "
+            "autenticada no perfil de --user-data-dir."
+        ),
+    )
+    parser.add_argument(
+        "--ui",
+        dest="headless",
+        action="store_false",
+        help="Abre a janela do Chrome, necessário na primeira execução para ler o QRCode.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Quantidade de navegadores enviando em paralelo. Cada navegador extra usa "
+            "o seu próprio perfil (<--user-data-dir>-workerN), que precisa ser vinculado "
+            "uma vez como aparelho conectado lendo o QRCode com --ui (padrão: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--attach-session",
+        metavar="URL",
+        nargs="?",
+        const="",
+        help=(
+            "URL do chromedriver de uma sessão já aberta (ex.: http://localhost:9515), "
+            "para pular a abertura do Chrome e o login. Sem URL ou sem --session-id, "
+            f"usa os dados gravados por --keep-session em {SESSION_FILE}."
+        ),
+    )
+    parser.add_argument(
+        "--session-id",
+        help="Identificador da sessão WebDriver a ser reaproveitada com --attach-session.",
+    )
+    parser.add_argument(
+        "--keep-session",
+        action="store_true",
+        help=(
+            "Mantém o navegador aberto ao final e grava URL e id da sessão em "
+            f"{SESSION_FILE} para uso com --attach-session/--session-id."
+        ),
     )
     parser.add_argument(
         "--max-wait",
@@ -122,13 +323,40 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=60,
         help="Tempo máximo (s) de espera pelos elementos da página",
     )
+    parser.add_argument(
+        "--qr-timeout",
+        type=int,
+        default=DEFAULT_QR_TIMEOUT,
+        help="Tempo máximo (s) para ler o QRCode com --ui (padrão: %(default)s)",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Nível de log (padrão: %(default)s)",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.attach_session is None:
+        if args.session_id:
+            parser.error("--session-id exige --attach-session")
+    elif not args.attach_session or not args.session_id:
+        saved = load_saved_session()
+        if saved is None:
+            parser.error(f"--attach-session sem URL/--session-id exige uma sessão salva em {SESSION_FILE}")
+        args.attach_session = args.attach_session or saved["command_executor"]
+        args.session_id = args.session_id or saved["session_id"]
+    # Aceita formatos como "+55"; o "+" na URL seria lido como espaço.
+    country_code = normalize_phone(args.country_code)
+    if not country_code:
+        parser.error("--country-code deve conter dígitos (ex.: 55)")
+    args.country_code = country_code
+    if args.header_rows < 0:
+        parser.error("--header-rows não pode ser negativo")
+    if args.workers < 1:
+        parser.error("--workers deve ser maior ou igual a 1")
+    if args.workers > 1 and (args.attach_session or args.keep_session):
+        parser.error("--workers maior que 1 não pode ser combinado com --attach-session/--keep-session")
+    return args
 
 
 def configure_logging(level: str) -> None:
@@ -139,37 +367,90 @@ def configure_logging(level: str) -> None:
     )
 
 
-def load_numbers(workbook_path: str | Path, sheet_name: str, column: str, limit: int | None) -> list[str]:
-    workbook = load_workbook(workbook_path, data_only=True)
-    worksheet = workbook[sheet_name]
-    numbers: list[str] = []
+def load_numbers(
+    workbook_path: str | Path,
+    sheet_name: str,
+    column: str,
+    limit: int | None,
+    header_rows: int = 1,
+) -> list[str]:
+    col_idx = column_index_from_string(column.upper())
+    # Remove duplicados durante a leitura, para que o `limit` interrompa a leitura
+    # assim que houver números únicos suficientes. O dict preserva a ordem de
+    # inserção e serve ao mesmo tempo de conjunto e de lista ordenada.
+    unique: dict[str, None] = {}
 
-    for cell in worksheet[column]:
-        if isinstance(cell.value, str) and cell.value.strip().lower() == "telefones":
-            continue
-        digits = normalize_phone(cell.value)
-        if not digits:
-            continue
-        numbers.append(digits)
-        if limit and len(numbers) >= limit:
-            break
-
-    workbook.close()
-    # Remove duplicados mantendo a ordem original.
-    seen = set()
-    ordered_unique: list[str] = []
-    for number in numbers:
-        if number not in seen:
-            ordered_unique.append(number)
-            seen.add(number)
-    return ordered_unique
+    reader = _iter_column_calamine if CalamineWorkbook is not None else _iter_column_openpyxl
+    with closing(reader(workbook_path, sheet_name, col_idx)) as values:
+        # O cabeçalho é verificado uma única vez, fora do laço principal: se tiver
+        # dígitos, provavelmente a planilha não tem cabeçalho e um número seria perdido.
+        for value in islice(values, header_rows):
+            if normalize_phone(value):
+                logging.warning(
+                    "Linha de cabeçalho ignorada contém dígitos (%s); use --header-rows 0 "
+                    "se a planilha não tiver cabeçalho",
+                    value,
+                )
+        for value in values:
+            digits = normalize_phone(value)
+            if not digits or digits in unique:
+                continue
+            unique[digits] = None
+            if limit and len(unique) >= limit:
+                break
+
+    return list(unique)
+
+
+def _iter_column_calamine(workbook_path: str | Path, sheet_name: str, col_idx: int) -> Iterator[object]:
+    """Lê a coluna `col_idx` (1-based) com o parser nativo do python-calamine."""
+
+    workbook = CalamineWorkbook.from_path(str(workbook_path))
+    try:
+        # Sem `skip_empty_area`, a primeira coluna devolvida é sempre a coluna A.
+        # `to_python` carrega a planilha inteira, então o `limit` não encurta a leitura.
+        rows = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        for row in rows:
+            if len(row) < col_idx:
+                continue
+            value = row[col_idx - 1]
+            # O calamine devolve números como float; 11999999999.0 viraria um dígito a mais.
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            yield value
+    finally:
+        workbook.close()
+
+
+def _iter_column_openpyxl(workbook_path: str | Path, sheet_name: str, col_idx: int) -> Iterator[object]:
+    """Lê a coluna `col_idx` (1-based) em modo somente leitura do openpyxl."""
+
+    # O modo somente leitura processa a planilha sob demanda, sem montar todas as
+    # células em memória, e `values_only` evita a criação de objetos `Cell`.
+    workbook = load_workbook(workbook_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        worksheet = workbook[sheet_name]
+        # A dimensão gravada no arquivo pode faltar ou estar incorreta (ex.: "A1:A1"
+        # em planilhas geradas por terceiros). Como a leitura é sequencial, descartá-la
+        # não tem custo e garante que o openpyxl leia todas as linhas.
+        worksheet.reset_dimensions()
+
+        for (value,) in worksheet.iter_rows(min_col=col_idx, max_col=col_idx, values_only=True):
+            yield value
+    finally:
+        workbook.close()
 
 
 def normalize_phone(value: object) -> str | None:
     if value is None:
         return None
-    digits = ''.join(filter(str.isdigit, str(value)))
-    return digits or None
+    return _normalize_str(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_str(value: str) -> str | None:
+    # Planilhas costumam repetir números; as repetições viram uma consulta ao cache.
+    return _NON_DIGIT_RE.sub("", value) or None
 
 
 def resolve_chromedriver_path() -> str:
@@ -184,20 +465,207 @@ def resolve_chromedriver_path() -> str:
     return chromedriver_py.binary_path
 
 
-def build_browser(max_wait: int, *, user_data_dir: Path | None, headless: bool) -> tuple[webdriver.Chrome, WebDriverWait]:
+def worker_profile_dir(user_data_dir: Path, index: int) -> Path:
+    return user_data_dir.with_name(f"{user_data_dir.name}-worker{index}")
+
+
+def build_browser_pool(
+    workers: int,
+    max_wait: int,
+    *,
+    user_data_dir: Path | None,
+    headless: bool,
+    profile_directory: str | None = None,
+    command_executor: str | None = None,
+    session_id: str | None = None,
+) -> list[PooledBrowser]:
+    """Cria `workers` navegadores, cada um com o seu próprio diretório de perfil.
+
+    O primeiro navegador usa `user_data_dir`; os demais usam `worker_profile_dir`.
+    Cada perfil é um aparelho conectado próprio, vinculado uma única vez com `--ui`:
+    copiar um perfil autenticado não funciona, pois o WhatsApp mantém uma conexão
+    por aparelho e derruba as cópias abertas ao mesmo tempo.
+    """
+
+    profile_dirs = [user_data_dir]
+    if user_data_dir:
+        profile_dirs += [worker_profile_dir(user_data_dir, index) for index in range(1, workers)]
+
+    pool: list[PooledBrowser] = []
+    try:
+        for profile_dir in profile_dirs:
+            browser, wait = build_browser(
+                max_wait,
+                user_data_dir=profile_dir,
+                headless=headless,
+                profile_directory=profile_directory,
+                command_executor=command_executor,
+                session_id=session_id,
+            )
+            pool.append((browser, wait, BrowserState()))
+    except Exception:
+        for browser, _, _ in pool:
+            browser.quit()
+        raise
+    return pool
+
+
+class SessionUnavailableError(RuntimeError):
+    """A sessão informada em `--attach-session` não existe mais ou não responde."""
+
+
+class _AttachedRemote(webdriver.Remote):
+    """`webdriver.Remote` que se conecta a uma sessão existente em vez de criar outra."""
+
+    def __init__(self, command_executor: str, session_id: str, options: webdriver.ChromeOptions) -> None:
+        self._attached_session_id = session_id
+        super().__init__(command_executor=command_executor, options=options)
+        try:
+            # Comando barato só para confirmar que a sessão ainda está viva.
+            logging.debug("Sessão %s ativa em %s", session_id, self.current_url)
+        except Exception as exc:  # noqa: BLE001 - falhas de conexão não são WebDriverException.
+            raise SessionUnavailableError(
+                f"A sessão {session_id} em {command_executor} não está mais ativa; "
+                "rode sem --attach-session para abrir um novo navegador"
+            ) from exc
+
+    def start_session(self, capabilities: dict, *args, **kwargs) -> None:
+        # Não enviamos o comando `newSession`: apenas adotamos a sessão informada.
+        self.session_id = self._attached_session_id
+        self.caps = {"browserName": "chrome"}
+
+
+def build_browser(
+    max_wait: int,
+    *,
+    user_data_dir: Path | None,
+    headless: bool,
+    profile_directory: str | None = None,
+    command_executor: str | None = None,
+    session_id: str | None = None,
+) -> tuple[webdriver.Chrome, WebDriverWait]:
+    """Cria o navegador pronto para uso e o `WebDriverWait` associado.
+
+    Quando `command_executor` e `session_id` são informados, reaproveita uma sessão
+    já aberta (e autenticada) em vez de iniciar outro Chrome; nesse caso as opções
+    de perfil e headless não se aplicam.
+
+    Além de aplicar as opções do Chrome, amplia o pool de conexões HTTP usado para
+    conversar com o chromedriver (veja `_enlarge_connection_pool`), de modo que
+    todo navegador criado por aqui reaproveite conexões keep-alive.
+    """
+
     options = webdriver.ChromeOptions()
+    if command_executor and session_id:
+        browser = _AttachedRemote(command_executor, session_id, options)
+        logging.info("Reaproveitando a sessão %s em %s", session_id, command_executor)
+        _enlarge_connection_pool(browser)
+        return browser, WebDriverWait(browser, max_wait)
+
     if user_data_dir:
+        user_data_dir.mkdir(parents=True, exist_ok=True)
         options.add_argument(f"--user-data-dir={user_data_dir}")
+        if profile_directory:
+            options.add_argument(f"--profile-directory={profile_directory}")
     if headless:
         options.add_argument("--headless=new")
         options.add_argument("--window-size=1920,1080")
+    for argument in LOW_FOOTPRINT_CHROME_ARGS:
+        options.add_argument(argument)
+    # Bloqueia o download de imagens (fotos de perfil, mídias) em todas as páginas.
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
     browser = _start_browser_with_automatic_driver(options)
+    _enlarge_connection_pool(browser)
     browser.maximize_window()
     wait = WebDriverWait(browser, max_wait)
     return browser, wait
 
 
+def load_saved_session() -> dict[str, str] | None:
+    """Lê a sessão gravada por `keep_session`, se houver uma válida."""
+
+    try:
+        data = json.loads(SESSION_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not data.get("command_executor") or not data.get("session_id"):
+        return None
+    return data
+
+
+def forget_saved_session(session_id: str | None) -> None:
+    """Remove `SESSION_FILE` se ele apontar para `session_id`, já encerrada."""
+
+    saved = load_saved_session()
+    if saved is not None and saved["session_id"] == session_id:
+        SESSION_FILE.unlink(missing_ok=True)
+
+
+def saved_session_for_profile(user_data_dir: Path | None) -> dict[str, str] | None:
+    """Retorna a sessão mantida por `--keep-session` que ocupa `user_data_dir`."""
+
+    saved = load_saved_session()
+    if saved is None or not user_data_dir or not saved.get("user_data_dir"):
+        return None
+    if Path(saved["user_data_dir"]).resolve() != user_data_dir.resolve():
+        return None
+    return saved
+
+
+def keep_session(browser: webdriver.Remote, command_executor: str | None, user_data_dir: Path | None) -> None:
+    """Grava os dados da sessão em `SESSION_FILE` e deixa o navegador aberto.
+
+    O perfil em uso também é gravado: enquanto esse Chrome estiver aberto, nenhum
+    outro pode ser iniciado no mesmo `--user-data-dir`.
+    """
+
+    service = getattr(browser, "service", None)
+    if command_executor is None and service is not None:
+        command_executor = service.service_url
+    profile = str(user_data_dir) if service is not None and user_data_dir else None
+    if profile is None:
+        # Sessão adotada: mantém o perfil registrado quando ela foi gravada.
+        saved = load_saved_session()
+        if saved is not None and saved["session_id"] == browser.session_id:
+            profile = saved.get("user_data_dir")
+    data = {
+        "command_executor": command_executor,
+        "session_id": browser.session_id,
+        "user_data_dir": profile,
+    }
+    SESSION_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if service is not None:
+        # Sem o processo associado, o Selenium não encerra o chromedriver quando o
+        # script termina, mantendo a sessão disponível para a próxima execução.
+        service.process = None
+    logging.info(
+        "Sessão mantida em %s. Reutilize com --attach-session %s --session-id %s",
+        SESSION_FILE,
+        command_executor,
+        browser.session_id,
+    )
+
+
+def _enlarge_connection_pool(browser: webdriver.Chrome, maxsize: int = CONNECTION_POOL_SIZE) -> None:
+    """Aumenta o pool de conexões do `RemoteConnection` do Selenium.
+
+    O `urllib3.PoolManager` padrão mantém uma única conexão por host; quando
+    comandos se sobrepõem, conexões excedentes são descartadas e reabertas a cada
+    requisição. Alteramos apenas o `maxsize` para preservar timeouts e demais
+    configurações definidas pelo Selenium.
+    """
+
+    conn = getattr(browser.command_executor, "_conn", None)
+    if not isinstance(conn, urllib3.PoolManager):
+        logging.debug("Pool de conexões do Selenium não reconhecido; mantendo o padrão")
+        return
+    conn.connection_pool_kw["maxsize"] = maxsize
+    conn.connection_pool_kw["block"] = False
+    # Descarta pools já criados para que o próximo comando use o novo tamanho.
+    conn.clear()
+
+
 def _start_browser_with_automatic_driver(options: webdriver.ChromeOptions) -> webdriver.Chrome:
     """Inicializa o Chrome usando Selenium Manager e aplica fallback se necessário."""
 
@@ -216,35 +684,180 @@ def _start_browser_with_automatic_driver(options: webdriver.ChromeOptions) -> we
 
 
 def wait_for_message_box(wait: WebDriverWait):
-    return wait.until(
-        EC.presence_of_element_located(
-            (
-                By.XPATH,
-                '/html/body/div[1]/div/div[1]/div[3]/div/div[4]/div/footer/div[1]/div/'
-                'span/div/div[2]/div/div[3]/div[1]/p',
+    return wait.until(_BOX_COND)
+
+
+class LoginRequiredError(RuntimeError):
+    """O WhatsApp Web pede o QRCode, mas não há janela para que ele seja lido."""
+
+
+def ensure_logged_in(
+    browser: webdriver.Chrome,
+    wait: WebDriverWait,
+    state: BrowserState,
+    *,
+    interactive: bool,
+    qr_timeout: float = DEFAULT_QR_TIMEOUT,
+) -> None:
+    """Abre o WhatsApp Web e confirma que a sessão está autenticada.
+
+    Sem essa verificação, um perfil novo em modo headless só falharia número a
+    número, cada um após `--max-wait` segundos. Em modo interativo aguardamos a
+    leitura do QRCode por até `qr_timeout` segundos; caso contrário, ou se a
+    página não chegar a um estado conhecido, levantamos `LoginRequiredError`.
+    """
+
+    browser.get(WHATSAPP_URL)
+    try:
+        wait.until(_LOGIN_STATE_COND)
+    except TimeoutException as exc:
+        raise LoginRequiredError(
+            "WhatsApp Web não exibiu a lista de conversas nem o QRCode a tempo; "
+            "verifique a conexão ou aumente --max-wait"
+        ) from exc
+    if not browser.find_elements(*_LOGGED_IN_LOCATOR):
+        if not interactive:
+            raise LoginRequiredError(
+                "WhatsApp Web não está autenticado neste perfil; rode com --ui (e o mesmo "
+                "--workers) para ler o QRCode de cada perfil"
             )
-        )
-    )
+        logging.info("Leia o QRCode na janela do Chrome para continuar (até %ss)", qr_timeout)
+        try:
+            WebDriverWait(browser, qr_timeout).until(_LOGGED_IN_COND)
+        except TimeoutException as exc:
+            raise LoginRequiredError(
+                "QRCode não foi lido a tempo; rode novamente com --ui ou aumente --qr-timeout"
+            ) from exc
+    state.loaded = True
+
+
+def open_chat(browser: webdriver.Chrome, wait: WebDriverWait, state: BrowserState, url: str) -> None:
+    """Abre a conversa de `url` na aba do WhatsApp Web.
+
+    Cada conversa ainda é um carregamento completo da página: o WhatsApp Web é
+    reinicializado a cada envio. A primeira chamada usa `browser.get` e aguarda o
+    título; as seguintes navegam via `navigate` e dispensam essa espera, já que a
+    caixa de mensagem é aguardada logo em seguida.
+    """
+
+    if state.loaded:
+        # Aguardamos o documento anterior ser descartado para não reaproveitar a
+        # caixa de mensagem da conversa anterior.
+        previous_page = browser.find_element(By.TAG_NAME, "html")
+        navigate(browser, state, url)
+        wait.until(EC.staleness_of(previous_page))
+        return
+
+    browser.get(url)
+    wait.until(_TITLE_COND)
+    state.loaded = True
+
 
+def navigate(browser: webdriver.Chrome, state: BrowserState, url: str) -> None:
+    """Navega para `url` pelo Chrome DevTools Protocol, quando disponível.
 
-def send_message(browser: webdriver.Chrome, wait: WebDriverWait, number: str, message: str, delay: float) -> bool:
+    O comando `Page.navigate` só responde depois que o novo documento é efetivado,
+    então a espera seguinte pelo descarte da página anterior é atendida já na
+    primeira verificação, sem intervalos de polling. Sessões sem CDP (como as
+    reaproveitadas via `--attach-session`) navegam por JavaScript.
+    """
+
+    if state.cdp_available and isinstance(browser, webdriver.Chrome):
+        try:
+            result = browser.execute_cdp_cmd("Page.navigate", {"url": url})
+        except WebDriverException as exc:
+            logging.debug("CDP indisponível, navegação seguirá via JavaScript: %s", exc)
+            state.cdp_available = False
+        else:
+            if result.get("errorText"):
+                raise WebDriverException(f"Falha ao abrir {url}: {result['errorText']}")
+            return
+
+    browser.execute_script("window.location.href = arguments[0];", url)
+
+
+def send_message(
+    browser: webdriver.Chrome,
+    wait: WebDriverWait,
+    state: BrowserState,
+    number: str,
+    message: str,
+    delay: float,
+    country_code: str = DEFAULT_COUNTRY_CODE,
+) -> bool:
+    url = _SEND_URL_FMT(country_code=country_code, number=number)
+    typed = False
+    previous_last_id: str | None = None
     try:
-        browser.get(
-            f'https://web.whatsapp.com/send/?phone=55{number}&text&type=phone_number&app_absent=0'
-        )
-        wait.until(EC.title_contains('WhatsApp'))
+        open_chat(browser, wait, state, url)
         input_box = wait_for_message_box(wait)
+        wait_for_send_slot(state)
+        # Lido logo antes de digitar: mensagens antigas carregadas depois entram acima
+        # da última, sem trocar o seu `data-id`.
+        previous_last_id, _ = last_outgoing_message(browser)
+        typed = True
         input_box.send_keys(message)
-        logging.info("Mensagem enviada para %s", number)
+        schedule_next_send(state, min(delay, MIN_SEND_INTERVAL))
+        logging.debug("Mensagem enviada para %s", number)
         return True
     except Exception as exc:  # noqa: BLE001 - queremos registrar qualquer falha.
         logging.error("Erro com %s: %s", number, exc)
+        if not typed:
+            schedule_next_send(state, delay)
         return False
     finally:
-        time.sleep(delay)
+        if typed:
+            wait_for_delivery(browser, delay, previous_last_id)
         dismiss_alert(browser)
 
 
+def schedule_next_send(state: BrowserState, interval: float) -> None:
+    """Define quando o próximo envio deste navegador pode acontecer.
+
+    A pausa não é cumprida aqui, e sim em `wait_for_send_slot`, logo antes de
+    digitar a próxima mensagem: assim o intervalo entre envios corre em paralelo
+    com a navegação e o carregamento da próxima conversa.
+    """
+
+    state.next_send_at = time.monotonic() + interval
+
+
+def wait_for_send_slot(state: BrowserState) -> None:
+    remaining = state.next_send_at - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def last_outgoing_message(browser: webdriver.Chrome) -> tuple[str | None, bool]:
+    """Retorna o `data-id` da última mensagem enviada na conversa e se ela já tem tique.
+
+    Uma única chamada de JavaScript por verificação, em vez de um comando WebDriver
+    por elemento.
+    """
+
+    message_id, sent = browser.execute_script(_LAST_OUTGOING_JS, OUTGOING_MESSAGE_SELECTOR, SENT_MARK_SELECTOR)
+    return message_id, bool(sent)
+
+
+def wait_for_delivery(browser: webdriver.Chrome, delay: float, previous_last_id: str | None) -> None:
+    """Aguarda o tique de envio da nova mensagem, usando `delay` como limite.
+
+    Em vez de dormir sempre `delay` segundos, retorna assim que a última mensagem
+    enviada na conversa aberta deixa de ser `previous_last_id` e recebe o tique,
+    evitando sair da conversa com a mensagem pendente. Tiques da barra lateral ou
+    de mensagens antigas não contam.
+    """
+
+    def delivered(driver: webdriver.Chrome) -> bool:
+        message_id, sent = last_outgoing_message(driver)
+        return sent and message_id is not None and message_id != previous_last_id
+
+    try:
+        WebDriverWait(browser, delay, poll_frequency=0.1).until(delivered)
+    except WebDriverException:  # Inclui o TimeoutException ao atingir o limite.
+        pass
+
+
 def dismiss_alert(browser: webdriver.Chrome) -> None:
     try:
         alert = browser.switch_to.alert
@@ -257,29 +870,75 @@ def dismiss_alert(browser: webdriver.Chrome) -> None:
 def process_numbers(
     browser: webdriver.Chrome,
     wait: WebDriverWait,
+    state: BrowserState,
     numbers: Iterable[str],
     message: str,
     delay: float,
+    country_code: str = DEFAULT_COUNTRY_CODE,
+    progress: ProgressLog | None = None,
 ) -> RunStats:
-    successful: list[str] = []
-    failed: list[str] = []
+    stats = RunStats()
+    # Com vários navegadores, o mesmo `ProgressLog` é compartilhado e o progresso
+    # registrado é o da execução inteira, não o de cada fatia.
+    if progress is None:
+        progress = ProgressLog()
 
     for number in numbers:
-        if send_message(browser, wait, number, message, delay):
-            successful.append(number)
+        success = send_message(browser, wait, state, number, message, delay, country_code)
+        if success:
+            stats.successful_count += 1
         else:
-            failed.append(number)
+            stats.failed_numbers.append(number)
+        progress.record(success)
 
-    return RunStats(successful_numbers=successful, failed_numbers=failed)
+    return stats
 
 
-def send_report(browser: webdriver.Chrome, wait: WebDriverWait, numbers: Iterable[str], message: str, delay: float) -> None:
-    for number in numbers:
-        normalized = normalize_phone(number)
-        if not normalized:
+def process_numbers_in_parallel(
+    pool: Sequence[PooledBrowser],
+    numbers: Sequence[str],
+    message: str,
+    delay: float,
+    country_code: str = DEFAULT_COUNTRY_CODE,
+) -> RunStats:
+    """Distribui os números entre os navegadores do pool e agrega os resultados."""
+
+    progress = ProgressLog(total=len(numbers))
+    if len(pool) == 1:
+        browser, wait, state = pool[0]
+        return process_numbers(browser, wait, state, numbers, message, delay, country_code, progress)
+
+    # Distribuição round-robin: cada navegador recebe uma fatia intercalada.
+    chunks = [numbers[index::len(pool)] for index in range(len(pool))]
+    with ThreadPoolExecutor(max_workers=len(pool)) as executor:
+        futures = [
+            executor.submit(
+                process_numbers, browser, wait, state, chunk, message, delay, country_code, progress
+            )
+            for (browser, wait, state), chunk in zip(pool, chunks)
+        ]
+        return RunStats.merge(future.result() for future in futures)
+
+
+def send_report(
+    browser: webdriver.Chrome,
+    wait: WebDriverWait,
+    state: BrowserState,
+    numbers: Iterable[str],
+    message: str,
+    delay: float,
+    country_code: str = DEFAULT_COUNTRY_CODE,
+) -> None:
+    normalized = [(number, normalize_phone(number)) for number in numbers]
+    for number, digits in normalized:
+        if not digits:
             logging.warning("Número de relatório inválido: %s", number)
-            continue
-        send_message(browser, wait, normalized, message, delay)
+    # Destinatários repetidos recebem o relatório uma única vez.
+    recipients = list(dict.fromkeys(digits for _, digits in normalized if digits))
+
+    # O envio reaproveita a aba já carregada (veja `open_chat`).
+    for number in recipients:
+        send_message(browser, wait, state, number, message, delay, country_code)
 
 
 def format_duration(seconds: float) -> str:
@@ -290,7 +949,7 @@ def build_report(stats: RunStats, elapsed: float) -> str:
     tempo_medio = elapsed / stats.total if stats.total else 0
     return (
         f"Total de números: {stats.total}\n"
-        f"Números enviados com sucesso: {len(stats.successful_numbers)}\n"
+        f"Números enviados com sucesso: {stats.successful_count}\n"
         f"Números enviados com erro: {len(stats.failed_numbers)}\n"
         f"Números com erro: {stats.failed_numbers}\n"
         f"Tempo de execução: {format_duration(elapsed)}\n"
@@ -304,34 +963,95 @@ def load_message(message_file: Path | None) -> str:
     return message_file.read_text(encoding="utf-8").strip()
 
 
+def _build_pool_from_args(args: argparse.Namespace) -> list[PooledBrowser]:
+    return build_browser_pool(
+        args.workers,
+        args.max_wait,
+        user_data_dir=args.user_data_dir,
+        headless=args.headless,
+        profile_directory=args.profile_directory,
+        command_executor=args.attach_session,
+        session_id=args.session_id,
+    )
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
     configure_logging(args.log_level)
 
     message = load_message(args.message_file)
-    numbers = load_numbers(args.workbook, args.sheet, args.column, args.limit)
+    numbers = load_numbers(args.workbook, args.sheet, args.column, args.limit, args.header_rows)
     if not numbers:
         logging.warning("Nenhum número válido encontrado na planilha.")
         return 1
 
     logging.info("Total de números únicos a enviar: %s", len(numbers))
 
-    browser, wait = build_browser(
-        args.max_wait,
-        user_data_dir=args.user_data_dir,
-        headless=args.headless,
-    )
+    auto_attached = False
+    if args.attach_session is None:
+        saved = saved_session_for_profile(args.user_data_dir)
+        if saved is not None and args.workers > 1:
+            logging.error(
+                "O perfil %s está em uso pela sessão mantida por --keep-session; "
+                "use --attach-session com --workers 1 ou encerre esse Chrome",
+                args.user_data_dir,
+            )
+            return 1
+        if saved is not None:
+            # Iniciar outro Chrome no mesmo perfil falharia ("user data directory is
+            # already in use"); adotamos a sessão, se ela ainda estiver viva.
+            args.attach_session = saved["command_executor"]
+            args.session_id = saved["session_id"]
+            auto_attached = True
+            logging.info("Reaproveitando a sessão mantida por --keep-session em %s", args.user_data_dir)
+
+    try:
+        pool = _build_pool_from_args(args)
+    except SessionUnavailableError as exc:
+        forget_saved_session(args.session_id)
+        if not auto_attached:
+            logging.error("%s", exc)
+            return 1
+        logging.warning("A sessão mantida por --keep-session foi encerrada; abrindo um novo navegador")
+        args.attach_session = args.session_id = None
+        pool = _build_pool_from_args(args)
+    browser, wait, state = pool[0]
 
-    start = time.time()
     try:
-        stats = process_numbers(browser, wait, numbers, message, args.delay)
+        # Sessões reaproveitadas podem ter uma janela visível para ler o QRCode.
+        interactive = not args.headless or bool(args.attach_session)
+        for pooled_browser, pooled_wait, pooled_state in pool:
+            ensure_logged_in(
+                pooled_browser,
+                pooled_wait,
+                pooled_state,
+                interactive=interactive,
+                qr_timeout=args.qr_timeout,
+            )
+
+        start = time.time()
+        stats = process_numbers_in_parallel(
+            pool, numbers, message, args.delay, args.country_code
+        )
         elapsed = time.time() - start
         report_message = build_report(stats, elapsed)
         logging.info("Resumo:\n%s", report_message)
-        send_report(browser, wait, args.report_numbers, report_message, args.delay)
+        send_report(
+            browser, wait, state, args.report_numbers, report_message, args.delay, args.country_code
+        )
         print(report_message)
+    except LoginRequiredError as exc:
+        logging.error("%s", exc)
+        return 1
     finally:
-        browser.quit()
+        if args.keep_session:
+            keep_session(browser, args.attach_session, args.user_data_dir)
+        else:
+            for pooled_browser, _, _ in pool:
+                pooled_browser.quit()
+            if args.attach_session:
+                # A sessão adotada foi encerrada; o arquivo não deve mais apontar para ela.
+                forget_saved_session(args.session_id)
 
     return 0
 